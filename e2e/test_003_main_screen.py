@@ -526,12 +526,12 @@ class TestMainScreen(GraphicUnitTest):
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.base_screen.BaseScreen.get_destdir_assets")
-    @patch("src.app.screens.main_screen.re.findall", side_effect=[True])
+    @patch("src.app.screens.main_screen.MainScreen.STABLE_VERSION_REGEXP")
     @patch("src.app.screens.main_screen.os.path.isfile", side_effect=[False])
     def test_on_release_flash_to_download_stable_zip_screen(
         self,
         mock_isfile,
-        mock_findall,
+        mock_stable_regexp,
         mock_get_destdir_assets,
         mock_get_locale,
         mock_manager,
@@ -539,6 +539,7 @@ class TestMainScreen(GraphicUnitTest):
         mock_set_background,
     ):
         mock_manager.get_screen = MagicMock()
+        mock_stable_regexp.search = MagicMock(return_value=True)
 
         screen = MainScreen()
         screen.version = "v24.03.0"
@@ -560,7 +561,7 @@ class TestMainScreen(GraphicUnitTest):
         mock_set_screen.assert_called_once_with(
             name="DownloadStableZipScreen", direction="left"
         )
-        mock_findall.assert_called_once_with(r"^v\d+\.\d+\.\d$", "v24.03.0")
+        mock_stable_regexp.search.assert_called_once_with("v24.03.0")
         pattern = re.compile(r".*v24\.03\.0\.zip")
         self.assertTrue(pattern.match(mock_isfile.call_args[0][0]))
 
@@ -572,12 +573,12 @@ class TestMainScreen(GraphicUnitTest):
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
     @patch("src.app.screens.base_screen.BaseScreen.get_destdir_assets")
-    @patch("src.app.screens.main_screen.re.findall", side_effect=[True])
+    @patch("src.app.screens.main_screen.MainScreen.STABLE_VERSION_REGEXP")
     @patch("src.app.screens.main_screen.os.path.isfile", side_effect=[True])
     def test_on_release_flash_to_warning_already_downloaded_zip_screen(
         self,
         mock_isfile,
-        mock_findall,
+        mock_stable_regexp,
         mock_get_destdir_assets,
         mock_get_locale,
         mock_manager,
@@ -585,6 +586,7 @@ class TestMainScreen(GraphicUnitTest):
         mock_set_background,
     ):
         mock_manager.get_screen = MagicMock()
+        mock_stable_regexp.search = MagicMock(return_value=True)
 
         screen = MainScreen()
         screen.version = "v24.03.0"
@@ -606,7 +608,7 @@ class TestMainScreen(GraphicUnitTest):
         mock_set_screen.assert_called_once_with(
             name="WarningAlreadyDownloadedScreen", direction="left"
         )
-        mock_findall.assert_called_once_with(r"^v\d+\.\d+\.\d$", "v24.03.0")
+        mock_stable_regexp.search.assert_called_once_with("v24.03.0")
         pattern = re.compile(r".*v24\.03\.0\.zip")
         self.assertTrue(pattern.match(mock_isfile.call_args[0][0]))
 
@@ -617,16 +619,20 @@ class TestMainScreen(GraphicUnitTest):
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch("src.app.screens.main_screen.re.findall", side_effect=[False, True])
+    @patch("src.app.screens.main_screen.MainScreen.STABLE_VERSION_REGEXP")
+    @patch("src.app.screens.main_screen.MainScreen.BETA_VERSION_REGEXP")
     def test_on_release_flash_to_download_beta_screen(
         self,
-        mock_findall,
+        mock_beta_regexp,
+        mock_stable_regexp,
         mock_get_locale,
         mock_manager,
         mock_set_screen,
         mock_set_background,
     ):
         mock_manager.get_screen = MagicMock()
+        mock_stable_regexp.search = MagicMock(return_value=False)
+        mock_beta_regexp.search = MagicMock(return_value=True)
 
         screen = MainScreen()
         screen.version = "odudex/krux_binaries"
@@ -643,12 +649,8 @@ class TestMainScreen(GraphicUnitTest):
         action(button)
 
         mock_get_locale.assert_any_call()
-        mock_findall.assert_has_calls(
-            [
-                call("^v\\d+\\.\\d+\\.\\d$", "odudex/krux_binaries"),
-                call(r"^odudex/krux_binaries", "odudex/krux_binaries"),
-            ]
-        )
+        mock_stable_regexp.search.assert_called_once_with("odudex/krux_binaries")
+        mock_beta_regexp.search.assert_called_once_with("odudex/krux_binaries")
         mock_set_background.assert_called_once_with(wid="main_flash", rgba=(0, 0, 0, 1))
         mock_set_screen.assert_called_once_with(
             name="DownloadBetaScreen", direction="left"
@@ -5,16 +5,49 @@ from kivy.tests.common import GraphicUnitTest
 from kivy.core.text import LabelBase, DEFAULT_FONT
 from src.app.screens.about_screen import AboutScreen
 
+NOTO_SANS_PATH = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), "..", "assets", "NotoSansCJK_Cy_SC_KR_Krux.ttf"
+    )
+)
+
+ABOUT_TEXT = "".join(
+    [
+        "[ref=SourceCode][b]v0.0.20-alpha-3[/b][/ref]",
+        "\n",
+        "\n",
+        "{follow}: ",
+        "[color=#00AABB]",
+        "[ref=X][u]@selfcustodykrux[/u][/ref]",
+        "[/color]",
+        "\n",
+        "\n",
+        "[color=#00FF00]",
+        "[ref=Back]",
+        "[u]{back}[/u]",
+        "[/ref]",
+        "[/color]",
+    ]
+)
+
 
 class TestAboutScreen(GraphicUnitTest):
 
     @classmethod
     def setUpClass(cls):
-        cwd_path = os.path.dirname(__file__)
-        rel_assets_path = os.path.join(cwd_path, "..", "assets")
-        assets_path = os.path.abspath(rel_assets_path)
-        noto_sans_path = os.path.join(assets_path, "NotoSansCJK_Cy_SC_KR_Krux.ttf")
-        LabelBase.register(DEFAULT_FONT, noto_sans_path)
+        # pylint: disable=protected-access
+        if LabelBase._fonts.get(DEFAULT_FONT, (None,))[0] != NOTO_SANS_PATH:
+            LabelBase.register(DEFAULT_FONT, NOTO_SANS_PATH)
+
+        # on_ref_press tests only dispatch the label's refs,
+        # so they can share one screen instead of building one per test;
+        # its canvas/locale updates are not queued, so they can't leak
+        # into the Clock of the other tests
+        with patch(
+            "src.app.screens.base_screen.BaseScreen.get_locale",
+            return_value="en_US.UTF-8",
+        ), patch("src.app.screens.about_screen.Clock.schedule_once"):
+            cls.screen = AboutScreen()
 
     @classmethod
     def teardown_class(cls):
@@ -40,24 +73,7 @@ class TestAboutScreen(GraphicUnitTest):
         self.assertEqual(grid.id, "about_screen_grid")
         self.assertEqual(label.id, "about_screen_label")
 
-        text = "".join(
-            [
-                "[ref=SourceCode][b]v0.0.20-alpha-3[/b][/ref]",
-                "\n",
-                "\n",
-                "follow us on X: ",
-                "[color=#00AABB]",
-                "[ref=X][u]@selfcustodykrux[/u][/ref]",
-                "[/color]",
-                "\n",
-                "\n",
-                "[color=#00FF00]",
-                "[ref=Back]",
-                "[u]Back[/u]",
-                "[/ref]",
-                "[/color]",
-            ]
-        )
+        text = ABOUT_TEXT.format(follow="follow us on X", back="Back")
 
         self.assertEqual(label.text, text)
         mock_get_locale.assert_any_call()
@@ -78,88 +94,33 @@ class TestAboutScreen(GraphicUnitTest):
 
         screen.update(name="ConfigKruxInstaller", key="locale", value="pt_BR.UTF-8")
 
-        text = "".join(
-            [
-                "[ref=SourceCode][b]v0.0.20-alpha-3[/b][/ref]",
-                "\n",
-                "\n",
-                "siga-nos no X: ",
-                "[color=#00AABB]",
-                "[ref=X][u]@selfcustodykrux[/u][/ref]",
-                "[/color]",
-                "\n",
-                "\n",
-                "[color=#00FF00]",
-                "[ref=Back]",
-                "[u]Voltar[/u]",
-                "[/ref]",
-                "[/color]",
-            ]
-        )
+        text = ABOUT_TEXT.format(follow="siga-nos no X", back="Voltar")
         self.assertEqual(label.text, text)
         mock_get_locale.assert_any_call()
 
-    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch(
-        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
-    )
     @patch("src.app.screens.about_screen.webbrowser")
-    def test_on_press_version(self, mock_webbrowser, mock_get_locale):
+    def test_on_press_version(self, mock_webbrowser):
         mock_webbrowser.open = MagicMock()
 
-        screen = AboutScreen()
-        self.render(screen)
+        label = self.screen.ids["about_screen_label"]
+        label.dispatch("on_ref_press", "SourceCode")
 
-        # get your Window instance safely
-        EventLoop.ensure_window()
-        button = screen.ids[f"{screen.id}_label"]
-
-        action = getattr(screen.__class__, f"on_ref_press_{button.id}")
-        action("Mock", "SourceCode")
-
-        mock_get_locale.assert_any_call()
         mock_webbrowser.open.assert_called_once_with(
             "https://selfcustody.github.io/krux/getting-started/installing/from-gui/"
         )
 
-    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch(
-        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
-    )
     @patch("src.app.screens.about_screen.webbrowser")
-    def test_on_press_x_formerly_known_as_twitter(
-        self, mock_webbrowser, mock_get_locale
-    ):
+    def test_on_press_x_formerly_known_as_twitter(self, mock_webbrowser):
         mock_webbrowser.open = MagicMock()
 
-        screen = AboutScreen()
-        self.render(screen)
-
-        # get your Window instance safely
-        EventLoop.ensure_window()
-        button = screen.ids[f"{screen.id}_label"]
+        label = self.screen.ids["about_screen_label"]
+        label.dispatch("on_ref_press", "X")
 
-        action = getattr(screen.__class__, f"on_ref_press_{button.id}")
-        action("Mock", "X")
-
-        mock_get_locale.assert_any_call()
         mock_webbrowser.open.assert_called_once_with("https://x.com/selfcustodykrux")
 
-    @patch.object(EventLoopBase, "ensure_window", lambda x: None)
-    @patch(
-        "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
-    )
     @patch("src.app.screens.about_screen.AboutScreen.set_screen")
-    def test_on_press_back(self, mock_set_screen, mock_get_locale):
-        screen = AboutScreen()
-        self.render(screen)
+    def test_on_press_back(self, mock_set_screen):
+        label = self.screen.ids["about_screen_label"]
+        label.dispatch("on_ref_press", "Back")
 
-        # get your Window instance safely
-        EventLoop.ensure_window()
-        button = screen.ids[f"{screen.id}_label"]
-
-        action = getattr(screen.__class__, f"on_ref_press_{button.id}")
-        action("Mock", "Back")
-
-        mock_get_locale.assert_any_call()
         mock_set_screen.assert_called_once_with(name="MainScreen", direction="right")
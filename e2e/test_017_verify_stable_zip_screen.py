@@ -51,7 +51,7 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         # get your Window instance safely
         EventLoop.ensure_window()
 
-        screen.verify_sha256(assets_dir="mockdir", version="v0.0.1")
+        screen.verify_sha256(zip_file="mockdir/krux-v0.0.1.zip")
 
         # patch assertions
         mock_get_locale.assert_called()
@@ -80,7 +80,9 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         # get your Window instance safely
         EventLoop.ensure_window()
 
-        screen.verify_signature(assets_dir="mockdir", version="v0.0.1")
+        screen.verify_signature(
+            assets_dir="mockdir", zip_file="mockdir/krux-v0.0.1.zip", filehash="ab"
+        )
 
         # patch assertions
         mock_get_locale.assert_called()
@@ -95,7 +97,9 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
             regexp=r"^.*\.zip$",
             signature=mock_sig_check_verifyer().data,
             pubkey=mock_pem_check_verifyer().data,
+            filehash="ab",
         )
+        mock_sig_verifyer().load.assert_not_called()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
@@ -141,8 +145,18 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.build_message_verify_signature",
         return_value="mock",
     )
+    @patch(
+        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.verify_sha256",
+        return_value=tuple(["mockhash", "mockhash", True]),
+    )
+    @patch(
+        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.verify_signature",
+        return_value=True,
+    )
     def test_on_enter(
         self,
+        mock_verify_signature,
+        mock_verify_sha256,
         mock_build_message_verify_signature,
         mock_build_message_verify_sha256,
         mock_get_destdir_assets,
@@ -163,11 +177,17 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         # patch assertions
         mock_get_locale.assert_called()
         mock_get_destdir_assets.assert_called()
+        version = screen.manager.get_screen().version
+        zip_file = os.path.join("mockdir", f"krux-{version}.zip")
+        mock_verify_sha256.assert_called_once_with(zip_file=zip_file)
+        mock_verify_signature.assert_called_once_with(
+            assets_dir="mockdir", zip_file=zip_file, filehash="mockhash"
+        )
         mock_build_message_verify_sha256.assert_called_once_with(
-            assets_dir="mockdir", version=screen.manager.get_screen().version
+            zip_file=zip_file, verify=("mockhash", "mockhash", True)
         )
         mock_build_message_verify_signature.assert_called_once_with(
-            assets_dir="mockdir", version=screen.manager.get_screen().version
+            assets_dir="mockdir", zip_file=zip_file, checksig=True
         )
 
     def test_prettyfy_hash(self):
@@ -187,11 +207,7 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch(
-        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.verify_sha256",
-        return_value=tuple(["mockhash", "mockhash", True]),
-    )
-    def test_build_message_verify_sha256(self, mock_verify_sha256, mock_get_locale):
+    def test_build_message_verify_sha256(self, mock_get_locale):
         screen = VerifyStableZipScreen()
         self.render(screen)
 
@@ -217,22 +233,17 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
             ]
         )
 
-        actual = screen.build_message_verify_sha256(assets_dir="mock", version="v0.0.1")
+        actual = screen.build_message_verify_sha256(
+            zip_file=p, verify=("mockhash", "mockhash", True)
+        )
         self.assertEqual(actual, expected)
         mock_get_locale.assert_any_call()
-        mock_verify_sha256.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch(
-        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.verify_sha256",
-        return_value=tuple(["mockhash", "nomockhash", False]),
-    )
-    def test_failed_build_message_verify_sha256(
-        self, mock_verify_sha256, mock_get_locale
-    ):
+    def test_failed_build_message_verify_sha256(self, mock_get_locale):
         screen = VerifyStableZipScreen()
         self.render(screen)
 
@@ -258,20 +269,17 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
             ]
         )
 
-        actual = screen.build_message_verify_sha256(assets_dir="mock", version="v0.0.1")
+        actual = screen.build_message_verify_sha256(
+            zip_file=p, verify=("mockhash", "nomockhash", False)
+        )
         self.assertEqual(actual, expected)
         mock_get_locale.assert_any_call()
-        mock_verify_sha256.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch(
-        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.verify_signature",
-        return_value=True,
-    )
-    def test_build_message_verify_signature(self, mock_verify_sig, mock_get_locale):
+    def test_build_message_verify_signature(self, mock_get_locale):
         screen = VerifyStableZipScreen()
         screen.success = True
         self.render(screen)
@@ -309,24 +317,17 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         )
 
         actual = screen.build_message_verify_signature(
-            assets_dir="mock", version="v0.0.1"
+            assets_dir="mock", zip_file=p, checksig=True
         )
 
         self.assertEqual(actual, expected)
         mock_get_locale.assert_any_call()
-        mock_verify_sig.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
         "src.app.screens.base_screen.BaseScreen.get_locale", return_value="en_US.UTF-8"
     )
-    @patch(
-        "src.app.screens.verify_stable_zip_screen.VerifyStableZipScreen.verify_signature",
-        return_value=False,
-    )
-    def test_failed_build_message_verify_signature(
-        self, mock_verify_sig, mock_get_locale
-    ):
+    def test_failed_build_message_verify_signature(self, mock_get_locale):
         screen = VerifyStableZipScreen()
         screen.success = True
         self.render(screen)
@@ -363,7 +364,7 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         )
 
         actual = screen.build_message_verify_signature(
-            assets_dir="mock", version="v0.0.1"
+            assets_dir="mock", zip_file=p, checksig=False
         )
 
         print(actual)
@@ -371,7 +372,6 @@ class TestVerifyStableZipScreen(GraphicUnitTest):
         print(expected)
         self.assertEqual(actual, expected)
         mock_get_locale.assert_any_call()
-        mock_verify_sig.assert_called_once()
 
     @patch.object(EventLoopBase, "ensure_window", lambda x: None)
     @patch(
@@ -46,10 +46,10 @@ class AboutScreen(BaseScreen):
             if args[1] == "Back":
                 self.set_screen(name="MainScreen", direction="right")
 
-            if args[1] == "X":
+            elif args[1] == "X":
                 webbrowser.open("https://x.com/selfcustodykrux")
 
-            if args[1] == "SourceCode":
+            elif args[1] == "SourceCode":
                 webbrowser.open(self.src_code)
 
         self.make_button(
@@ -89,7 +89,7 @@ class AskPermissionDialoutScreen(BaseScreen):
                     self.error(str(err))
                     self.redirect_exception(exception=err)
 
-            if args[1] == "Deny":
+            elif args[1] == "Deny":
                 AskPermissionDialoutScreen.quit_app()
 
         self.make_button(
@@ -47,10 +47,10 @@ class ErrorScreen(BaseScreen):
             if args[1] == "Back":
                 self.set_screen(name="GreetingsScreen", direction="right")
 
-            if args[1] == "Quit":
+            elif args[1] == "Quit":
                 ErrorScreen.quit_app()
 
-            if args[1] == "ReportIssue":
+            elif args[1] == "ReportIssue":
                 webbrowser.open(f"{self.src_code}/issues")
 
         self.make_button(
@@ -36,6 +36,9 @@ class MainScreen(BaseScreen):
     .. versionadded:: 0.0.2-alpha-1
     """
 
+    STABLE_VERSION_REGEXP = re.compile(r"^v\d+\.\d+\.\d$")
+    BETA_VERSION_REGEXP = re.compile(r"^odudex/krux_binaries")
+
     def __init__(self, **kwargs):
         super().__init__(wid="main_screen", name="MainScreen", **kwargs)
 
@@ -214,7 +217,7 @@ class MainScreen(BaseScreen):
                 partials = []
 
                 # Check if any official release file exists
-                if re.findall(r"^v\d+\.\d+\.\d$", self.version):
+                if MainScreen.STABLE_VERSION_REGEXP.search(self.version):
                     resources = MainScreen.get_destdir_assets()
                     zipfile = os.path.join(resources, f"krux-{self.version}.zip")
 
@@ -241,7 +244,7 @@ class MainScreen(BaseScreen):
                     )
 
                 # check if release is beta
-                elif re.findall("^odudex/krux_binaries", self.version):
+                elif MainScreen.BETA_VERSION_REGEXP.search(self.version):
                     to_screen = "DownloadBetaScreen"
                     screen = self.manager.get_screen(to_screen)
                     partials.append(
@@ -86,6 +86,8 @@ class SelectDeviceScreen(BaseScreen):
         def on_update():
             if key == "version":
                 self.enabled_devices = []
+                cleanre = re.compile("\\[.*?\\]")
+                clean_text = re.sub(cleanre, "", value)
 
                 for device in (
                     "m5stickv",
@@ -96,8 +98,6 @@ class SelectDeviceScreen(BaseScreen):
                     "cube",
                     "wonder_mv",
                 ):
-                    cleanre = re.compile("\\[.*?\\]")
-                    clean_text = re.sub(cleanre, "", value)
                     if (
                         clean_text in VALID_DEVICES_VERSIONS
                         and device not in VALID_DEVICES_VERSIONS.get(clean_text, [])
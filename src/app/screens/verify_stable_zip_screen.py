@@ -56,14 +56,22 @@ class VerifyStableZipScreen(BaseScreen):
         def on_update():
             if key == "verify":
                 assets_dir = VerifyStableZipScreen.get_destdir_assets()
-                main_screen = self.manager.get_screen("MainScreen")
+                version = self.manager.get_screen("MainScreen").version
+                zip_file = os.path.join(assets_dir, f"krux-{version}.zip")
+
+                # the zip is hashed only once: its sha256 digest is reused
+                # by the signature verification
+                sha256 = self.verify_sha256(zip_file=zip_file)
+                checksig = self.verify_signature(
+                    assets_dir=assets_dir, zip_file=zip_file, filehash=sha256[0]
+                )
 
                 verified = self.build_message_verify_sha256(
-                    assets_dir=assets_dir, version=main_screen.version
+                    zip_file=zip_file, verify=sha256
                 )
 
                 verified += self.build_message_verify_signature(
-                    assets_dir=assets_dir, version=main_screen.version
+                    assets_dir=assets_dir, zip_file=zip_file, checksig=checksig
                 )
 
                 self.ids[f"{self.id}_label"].text = verified
@@ -105,7 +113,7 @@ class VerifyStableZipScreen(BaseScreen):
 
                 self.set_screen(name="UnzipStableScreen", direction="left")
 
-            if args[1] == "Back":
+            elif args[1] == "Back":
                 self.set_screen(name="MainScreen", direction="right")
 
         verifying_msg = self.translate("Verifying integrity and authenticity")
@@ -126,15 +134,11 @@ class VerifyStableZipScreen(BaseScreen):
         fn = partial(self.update, name=self.name, key="verify")
         Clock.schedule_once(fn)
 
-    def verify_sha256(
-        self, assets_dir: str, version: str
-    ) -> typing.Tuple[str, str, bool]:
+    def verify_sha256(self, zip_file: str) -> typing.Tuple[str, str, bool]:
         """Do the verification when entering on screen"""
         # verify integrity
-        sha256_0 = Sha256Verifyer(filename=f"{assets_dir}/krux-{version}.zip")
-        sha256_1 = Sha256CheckVerifyer(
-            filename=f"{assets_dir}/krux-{version}.zip.sha256.txt"
-        )
+        sha256_0 = Sha256Verifyer(filename=zip_file)
+        sha256_1 = Sha256CheckVerifyer(filename=f"{zip_file}.sha256.txt")
 
         sha256_0.load()
         sha256_1.load()
@@ -151,17 +155,16 @@ class VerifyStableZipScreen(BaseScreen):
         ]
         return "\n".join(subsets)
 
-    def build_message_verify_sha256(self, assets_dir: str, version: str) -> str:
+    def build_message_verify_sha256(
+        self, zip_file: str, verify: typing.Tuple[str, str, bool]
+    ) -> str:
         """Create a message which user can assert the integrity verification"""
-        # memorize result
-        verify = self.verify_sha256(assets_dir=assets_dir, version=version)
         hash_0 = verify[0]
         hash_1 = verify[1]
         checksummed = verify[2]
 
         self.success = checksummed
 
-        filepath = os.path.join(assets_dir, f"krux-{version}.zip")
         integrity_msg = self.translate("Integrity verification")
         computed_msg = self.translate("computed hash from")
         provided_msg = self.translate("provided hash from")
@@ -183,12 +186,12 @@ class VerifyStableZipScreen(BaseScreen):
                 f"[b][color={hash_color}]{hash_msg}[/color][/b]",
                 "\n",
                 "\n",
-                f"[b]{computed_msg} [color=#777777]{filepath}[/color][/b]",
+                f"[b]{computed_msg} [color=#777777]{zip_file}[/color][/b]",
                 "\n",
                 sha_0,
                 "\n",
                 "\n",
-                f"[b]{provided_msg} [color=#777777]{filepath}.sha256.txt[/color][/b]",
+                f"[b]{provided_msg} [color=#777777]{zip_file}.sha256.txt[/color][/b]",
                 "\n",
                 sha_1,
                 "\n",
@@ -196,25 +199,28 @@ class VerifyStableZipScreen(BaseScreen):
             ]
         )
 
-    def verify_signature(self, assets_dir: str, version: str) -> bool | str:
-        """Verify official release's signature"""
+    def verify_signature(
+        self, assets_dir: str, zip_file: str, filehash: str
+    ) -> bool | str:
+        """Verify official release's signature against zip's sha256 `filehash`"""
         # verify signature
-        signature = SigCheckVerifyer(filename=f"{assets_dir}/krux-{version}.zip.sig")
+        signature = SigCheckVerifyer(filename=f"{zip_file}.sig")
         publickey = PemCheckVerifyer(filename=f"{assets_dir}/selfcustody.pem")
         signature.load()
         publickey.load()
         sig_verifyer = SigVerifyer(
-            filename=f"{assets_dir}/krux-{version}.zip",
+            filename=zip_file,
             regexp=r"^.*\.zip$",
             signature=signature.data,
             pubkey=publickey.data,
+            filehash=filehash,
         )
-        sig_verifyer.load()
         return sig_verifyer.verify()
 
-    def build_message_verify_signature(self, assets_dir: str, version: str) -> str:
+    def build_message_verify_signature(
+        self, assets_dir: str, zip_file: str, checksig: bool | str
+    ) -> str:
         """Create a message which user can assert authenticity the verification"""
-        checksig = self.verify_signature(assets_dir=assets_dir, version=version)
         self.success = self.success and checksig
 
         authenticity_msg = self.translate("Authenticity verification")
@@ -225,7 +231,6 @@ class VerifyStableZipScreen(BaseScreen):
         check_msg = self.translate("you can check manually with the following command")
         proceed = self.translate("Proceed")
         back = self.translate("Back")
-        filepath = os.path.join(assets_dir, f"krux-{version}.zip")
         pempath = os.path.join(assets_dir, "selfcustody.pem")
 
         if checksig:
@@ -247,11 +252,11 @@ class VerifyStableZipScreen(BaseScreen):
                 "\n",
                 "\n",
                 "[b]",
-                f"openssl sha256< [color=#777777]{filepath}[/color] -binary | \\",
+                f"openssl sha256< [color=#777777]{zip_file}[/color] -binary | \\",
                 "\n"
                 f"openssl pkeyutl -verify -pubin -inkey [color=#777777]{pempath}[/color] \\",
                 "\n",
-                f"-sigfile [color=#777777]{filepath}.sig[/color]",
+                f"-sigfile [color=#777777]{zip_file}.sig[/color]",
                 "[/b]",
                 "\n",
                 "\n",
@@ -59,7 +59,7 @@ class WarningAfterAirgapUpdateScreen(BaseScreen):
             if args[1] == "MainScreen":
                 self.set_screen(name="MainScreen", direction="right")
 
-            if args[1] == "Quit":
+            elif args[1] == "Quit":
                 App.get_running_app().stop()
 
         self.make_image(
@@ -58,7 +58,7 @@ class WarningAlreadyDownloadedScreen(BaseScreen):
                 Clock.schedule_once(fn, 0)
                 self.set_screen(name="DownloadStableZipScreen", direction="left")
 
-            if args[1] == "VerifyStableZipScreen":
+            elif args[1] == "VerifyStableZipScreen":
                 self.set_screen(name="VerifyStableZipScreen", direction="left")
 
         self.make_button(
@@ -57,7 +57,7 @@ class WarningBeforeAirgapUpdateScreen(BaseScreen):
             if args[1] == "MainScreen":
                 self.set_screen(name="MainScreen", direction="left")
 
-            if args[1] == "AirgapUpdateScreen":
+            elif args[1] == "AirgapUpdateScreen":
                 self.set_screen(name="AirgapUpdateScreen", direction="right")
 
         self.make_button(
@@ -44,7 +44,7 @@ class WarningBetaScreen(BaseScreen):
             if args[1] == "MainScreen":
                 self.set_screen(name="MainScreen", direction="right")
 
-            if args[1] == "SelectVersion":
+            elif args[1] == "SelectVersion":
                 self.set_screen(name="SelectVersionScreen", direction="right")
 
         self.make_button(
@@ -73,7 +73,7 @@ class WarningWipeScreen(BaseScreen):
 
                 self.set_screen(name=args[1], direction="left")
 
-            if args[1] == "MainScreen":
+            elif args[1] == "MainScreen":
                 self.set_screen(name="MainScreen", direction="right")
 
         self.make_button(
@@ -34,7 +34,7 @@ I18N_FILES = []
 for f in os.listdir(I18N_DIRNAME):
     i18n_file = os.path.join(I18N_DIRNAME, f)
     if os.path.isfile(i18n_file):
-        if re.findall(r"^[a-z]+\_[A-Z]+\.UTF-8\.json$", f):
+        if re.search(r"^[a-z]+\_[A-Z]+\.UTF-8\.json$", f):
             _locale = f.split(".json")
             I18N_LOCALES.append({"name": _locale[0], "file": i18n_file})
 
@@ -26,6 +26,7 @@ Some constants to be used accros application
 """
 
 from typing import Any
+from functools import lru_cache
 import sys
 import os
 
@@ -56,10 +57,12 @@ VALID_DEVICES_VERSIONS = {
 }
 
 
+@lru_cache(maxsize=1)
 def _open_pyproject() -> dict[str, Any]:
     """
     Open root pyprojet.toml file to get some constant datas
-    like name, version and description
+    like name, version and description (the file is read and
+    parsed only once; successive calls reuse the parsed data)
     """
     if sys.version_info.minor <= 10:
         # pylint: disable=import-outside-toplevel
@@ -54,7 +54,7 @@ class BaseDownloader(Trigger):
     @url.setter
     def url(self, value: str):
         """The asset's url to be downloaded"""
-        if re.findall(BaseDownloader.REGEXP, value):
+        if re.search(BaseDownloader.REGEXP, value):
             self.debug(f"url::setter={value}")
             self._url = value
         else:
@@ -52,6 +52,30 @@ class BaseFlasher(Trigger):
         1500000,
     )
 
+    # USB vendor id of serial converter and kflash board of each device
+    DEVICES_VID = {
+        "amigo": "0403",
+        "amigo_tft": "0403",
+        "amigo_ips": "0403",
+        "m5stickv": "0403",
+        "bit": "0403",
+        "cube": "0403",
+        "dock": "7523",
+        "yahboom": "7523",
+        "wonder_mv": "7523",
+    }
+    DEVICES_BOARD = {
+        "amigo": "goE",
+        "amigo_tft": "goE",
+        "amigo_ips": "goE",
+        "m5stickv": "goE",
+        "bit": "goE",
+        "yahboom": "goE",
+        "cube": "goE",
+        "dock": "dan",
+        "wonder_mv": "dan",
+    }
+
     def __init__(self):
         super().__init__()
         self.ktool = KTool()
@@ -80,13 +104,8 @@ class BaseFlasher(Trigger):
     @port.setter
     def port(self, value: str):
         """Setter for available ports's full path by giving device name"""
-        if value in ("amigo", "amigo_tft", "amigo_ips", "m5stickv", "bit", "cube"):
-            vid = "0403"
-
-        elif value in ("dock", "yahboom", "wonder_mv"):
-            vid = "7523"
-
-        else:
+        vid = BaseFlasher.DEVICES_VID.get(value)
+        if vid is None:
             raise ValueError(f"Device not implemented: {value}")
 
         self._available_ports_generator = list_ports.grep(vid)
@@ -103,25 +122,13 @@ class BaseFlasher(Trigger):
     @board.setter
     def board(self, value: str):
         """Setter for board giving device name"""
-        if value in (
-            "amigo",
-            "amigo_tft",
-            "amigo_ips",
-            "m5stickv",
-            "bit",
-            "yahboom",
-            "cube",
-        ):
-            self._board = "goE"
-            self.debug(f"board::setter={self._board}")
-
-        elif value in ("dock", "wonder_mv"):
-            self._board = "dan"
-            self.debug(f"board::setter={self._board}")
-
-        else:
+        board = BaseFlasher.DEVICES_BOARD.get(value)
+        if board is None:
             raise ValueError(f"Device not implemented: {value}")
 
+        self._board = board
+        self.debug(f"board::setter={self._board}")
+
     @property
     def baudrate(self) -> int:
         """Getter for baudrate"""
@@ -33,11 +33,10 @@ class Wiper(BaseFlasher):
     def wipe(self, device: str):
         """Detect available ports, try default erase process and
         it not work, try custom port"""
-        for dev in VALID_DEVICES:
-            if dev == device:
-                self.info(f"Detected valid {device} to be wiped")
-                self.port = device
-                self.board = device
+        if device in VALID_DEVICES:
+            self.info(f"Detected valid {device} to be wiped")
+            self.port = device
+            self.board = device
 
         if self.is_port_working(self.port):
             try:
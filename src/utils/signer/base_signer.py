@@ -86,7 +86,7 @@ class BaseSigner(Trigger):
     @filehash.setter
     def filehash(self, value: str):
         """Setter for filehash"""
-        if re.findall(r"[a-fA-F0-9]{64}", value):
+        if re.search(r"[a-fA-F0-9]{64}", value):
             self.debug(f"filehash::setter={value}")
             self._filehash = value
         else:
@@ -104,7 +104,7 @@ class BaseSigner(Trigger):
     @signature.setter
     def signature(self, value: str):
         """Setter for signature giving a well formated string"""
-        if re.findall(
+        if re.search(
             r"^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$", value
         ):
             self.debug(f"signature::setter={value}")
@@ -124,7 +124,7 @@ class BaseSigner(Trigger):
     @pubkey.setter
     def pubkey(self, value: typing.SupportsBytes):
         """Setter for public key certificate"""
-        if re.findall("[a-f0-9]{64}", value):
+        if re.search("[a-f0-9]{64}", value):
             self.debug(f"pubkey::setter={value}")
             pubkey_data = f"{ASN1_STRUCTURE_FOR_PUBKEY}{value}"
 
@@ -23,6 +23,7 @@
 base_verifyer.py
 """
 
+import hashlib
 import typing
 from ..trigger import Trigger
 
@@ -30,6 +31,8 @@ from ..trigger import Trigger
 class BaseVerifyer(Trigger):
     """Base class for verifyers"""
 
+    BLOCK_SIZE = 1 << 20
+
     def __init__(self, filename: str, read_mode: str):
         super().__init__()
         self.filename = filename
@@ -74,3 +77,20 @@ class BaseVerifyer(Trigger):
         """Setter for data"""
         self.debug(f"data::setter={value}")
         self._data = value
+
+    def sha256sum(self) -> "hashlib._Hash":
+        """
+        Compute the sha256 of file, reading it in blocks of BLOCK_SIZE
+        bytes, so the whole file never needs to be kept in memory
+        """
+        sha256_hash = hashlib.sha256()
+
+        self.debug(f"sha256sum::{self.filename}::{self.read_mode}")
+
+        # pylint: disable=unspecified-encoding
+        with open(self.filename, self.read_mode) as f_data:
+            # do not log each block: firmware zips have many of them
+            for byte_block in iter(lambda: f_data.read(self.BLOCK_SIZE), b""):
+                sha256_hash.update(byte_block)
+
+        return sha256_hash
@@ -33,7 +33,7 @@ class CheckVerifyer(BaseVerifyer):
     """basic class for *CheckVerifyer class (do not use directly)"""
 
     def __init__(self, filename: str, read_mode: str, regexp: typing.re):
-        if not re.findall(regexp, filename):
+        if not re.search(regexp, filename):
             raise ValueError(f"Invalid file: {filename} do not assert with {regexp}")
 
         if not os.path.exists(filename):
@@ -24,7 +24,6 @@ sha256_verifyer.py
 """
 
 import os
-import hashlib
 from .base_verifyer import BaseVerifyer
 
 
@@ -39,18 +38,8 @@ class Sha256Verifyer(BaseVerifyer):
 
     def load(self):
         """Load data from file and assigns its sha256sum"""
-        sha256_hash = hashlib.sha256()
-
         self.debug(f"load::{self.filename}::{self.read_mode}")
-
-        # pylint: disable=unspecified-encoding
-        with open(self.filename, self.read_mode) as f_data:
-            # Read and update hash string value in blocks of 1K bytes
-            for byte_block in iter(lambda: f_data.read(1024), b""):
-                self.debug(f"load::block={byte_block}")
-                sha256_hash.update(byte_block)
-
-            self.data = sha256_hash.hexdigest()
+        self.data = self.sha256sum().hexdigest()
 
     def verify(self, sha256sum: str) -> bool:
         """Verify self.hash against a providede sha256_hash"""
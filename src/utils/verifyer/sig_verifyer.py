@@ -26,21 +26,42 @@ sig_verifyer.py
 import typing
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import serialization, hashes, asymmetric
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from .check_verifyer import CheckVerifyer
 
 
 class SigVerifyer(CheckVerifyer):
-    """Verify file signature agains .sig and .pem data"""
+    """
+    Verify file signature agains .sig and .pem data
 
-    def __init__(self, filename: str, signature: str, pubkey: str, regexp: typing.re):
+    If the sha256 of file was already computed (e.g. by :class:`Sha256Verifyer`),
+    give it as `filehash` and do not call `load`, so the file isn't read twice
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        signature: str,
+        pubkey: str,
+        regexp: typing.re,
+        filehash: str | None = None,
+    ):
         super().__init__(filename=filename, read_mode="rb", regexp=regexp)
         self.certificate = serialization.load_pem_public_key(pubkey)
         self.signature = signature
 
+        if filehash is not None:
+            self.data = bytes.fromhex(filehash)
+
+    def load(self):
+        """Load the sha256 digest of file"""
+        self.debug(f"load::{self.filename}::{self.read_mode}")
+        self.data = self.sha256sum().digest()
+
     def verify(self) -> bool:
         """Apply signature verification against a signature data and public key data"""
         try:
-            algorithm = asymmetric.ec.ECDSA(hashes.SHA256())
+            algorithm = asymmetric.ec.ECDSA(Prehashed(hashes.SHA256()))
             self.certificate.verify(self.signature, self.data, algorithm)
             return True
         except InvalidSignature as exc_info:
@@ -13,6 +13,12 @@ description = "Hello World!"
 
 class TestConstants(TestCase):
 
+    def setUp(self):
+        _open_pyproject.cache_clear()
+
+    def tearDown(self):
+        _open_pyproject.cache_clear()
+
     @patch("sys.version_info")
     @patch("builtins.open", new_callable=mock_open, read_data=PYPROJECT_STR)
     def test_open_pyproject_with_py_minor_version_10(
@@ -92,6 +98,13 @@ class TestConstants(TestCase):
             str(exc_info.exception), f"{pyproject_filename} is not valid toml file"
         )
 
+    @patch("builtins.open", new_callable=mock_open, read_data=PYPROJECT_STR)
+    def test_open_pyproject_once(self, open_mock):
+        self.assertEqual(get_name(), "test")
+        self.assertEqual(get_version(), "0.0.1")
+        self.assertEqual(get_description(), "Hello World!")
+        open_mock.assert_called_once()
+
     @patch("builtins.open", new_callable=mock_open, read_data=PYPROJECT_STR)
     def test_get_name(self, open_mock):
         name = get_name()
@@ -1,6 +1,6 @@
 import io
 from unittest import TestCase
-from unittest.mock import patch, mock_open
+from unittest.mock import patch, mock_open, MagicMock
 from src.utils.verifyer.check_verifyer import CheckVerifyer
 
 mock_file = io.BytesIO()
@@ -13,20 +13,20 @@ mock_file.write(
 
 class TestCheckVerifyerDownloader(TestCase):
 
-    @patch("re.findall", return_value=["test.mock"])
+    @patch("re.search", return_value=MagicMock())
     @patch("os.path.exists", return_value=True)
-    def test_init(self, mock_exists, mock_findall):
+    def test_init(self, mock_exists, mock_search):
         c = CheckVerifyer(filename="test.mock", read_mode="r", regexp=r".*mock")
         self.assertEqual(c.filename, "test.mock")
-        mock_findall.assert_called_once_with(r".*mock", "test.mock")
+        mock_search.assert_called_once_with(r".*mock", "test.mock")
         mock_exists.assert_called_once_with("test.mock")
 
-    @patch("re.findall", return_value=[])
-    def test_fail_init_re(self, mock_findall):
+    @patch("re.search", return_value=None)
+    def test_fail_init_re(self, mock_search):
         with self.assertRaises(ValueError) as exc_info:
             CheckVerifyer(filename="test.mock", read_mode="r", regexp=r".*notmock")
 
-        mock_findall.assert_called_once_with(r".*notmock", "test.mock")
+        mock_search.assert_called_once_with(r".*notmock", "test.mock")
         self.assertEqual(
             str(exc_info.exception),
             "Invalid file: test.mock do not assert with .*notmock",
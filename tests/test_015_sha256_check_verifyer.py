@@ -18,8 +18,8 @@ class TestSha256CheckVerifyerDownloader(TestCase):
     def test_fail_init(self, mock_exists):
         with self.assertRaises(ValueError) as exc_info:
             Sha256CheckVerifyer(filename="test.mock.txt")
-            mock_exists.assert_called_once_with("test.mock.txt")
 
+        mock_exists.assert_not_called()
         self.assertEqual(
             str(exc_info.exception),
             "Invalid file: test.mock.txt do not assert with .*\\.sha256\\.txt",
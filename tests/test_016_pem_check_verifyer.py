@@ -21,8 +21,8 @@ class TestPemCheckVerifyerDownloader(TestCase):
     def test_fail_init(self, mock_exists):
         with self.assertRaises(ValueError) as exc_info:
             PemCheckVerifyer(filename="test.mock.txt")
-            mock_exists.assert_called_once_with("test.mock.txt")
 
+        mock_exists.assert_not_called()
         self.assertEqual(
             str(exc_info.exception),
             "Invalid file: test.mock.txt do not assert with .*\\.pem",
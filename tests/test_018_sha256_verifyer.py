@@ -22,8 +22,8 @@ class TestSha256VerifyerDownloader(TestCase):
     def test_fail_init(self, mock_exists):
         with self.assertRaises(ValueError) as exc_info:
             Sha256Verifyer(filename="test.mock")
-            mock_exists.assert_called_once_with("test.mock")
 
+        mock_exists.assert_called_once_with("test.mock")
         self.assertEqual(
             str(exc_info.exception),
             "File test.mock do not exist",
@@ -47,3 +47,13 @@ class TestSha256VerifyerDownloader(TestCase):
         open_mock.assert_called_once_with("test.mock", "rb")
         verify = sha.verify(MOCK_SHA)
         self.assertTrue(verify)
+
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
+    @patch.object(Sha256Verifyer, "BLOCK_SIZE", 16)
+    def test_load_in_blocks(self, open_mock, mock_exists):
+        sha = Sha256Verifyer(filename="test.mock")
+        sha.load()
+        mock_exists.assert_called_once_with("test.mock")
+        open_mock.assert_called_once_with("test.mock", "rb")
+        self.assertEqual(sha.data, MOCK_SHA)
@@ -1,3 +1,4 @@
+import hashlib
 from unittest import TestCase
 from unittest.mock import patch, mock_open
 from src.utils.verifyer.sig_verifyer import SigVerifyer
@@ -41,9 +42,9 @@ class TestSigVerifyerDownloader(TestCase):
                 pubkey=MOCK_PEM,
                 regexp=r".*\.txt",
             )
-            mock_exists.assert_called_once_with("test.zip")
-            open_mock.assert_called_once_with("test.zip", "rb")
 
+        mock_exists.assert_not_called()
+        open_mock.assert_not_called()
         self.assertEqual(
             str(exc_info.exception),
             "Invalid file: test.zip do not assert with .*\\.txt",
@@ -60,6 +61,20 @@ class TestSigVerifyerDownloader(TestCase):
         mock_exists.assert_called_once_with("test")
         open_mock.assert_called_once_with("test", "rb")
 
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
+    @patch.object(SigVerifyer, "BLOCK_SIZE", 16)
+    def test_load_digest_in_blocks(self, open_mock, mock_exists):
+        sig = SigVerifyer(
+            filename="test.zip", signature=MOCK_SIG, pubkey=MOCK_PEM, regexp=r".*\.zip"
+        )
+        sig.load()
+
+        mock_exists.assert_called_once_with("test.zip")
+        open_mock.assert_called_once_with("test.zip", "rb")
+        self.assertEqual(sig.data, hashlib.sha256(MOCK_ZIP).digest())
+        self.assertEqual(sig.verify(), True)
+
     @patch("os.path.exists", return_value=True)
     @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
     def test_verify(self, open_mock, mock_exists):
@@ -90,3 +105,21 @@ class TestSigVerifyerDownloader(TestCase):
         mock_exists.assert_called_once_with("test.zip")
         open_mock.assert_called_once_with("test.zip", "rb")
         self.assertEqual(result, False)
+
+    @patch("os.path.exists", return_value=True)
+    @patch("builtins.open", new_callable=mock_open, read_data=MOCK_ZIP)
+    def test_verify_filehash(self, open_mock, mock_exists):
+        sig = SigVerifyer(
+            filename="test.zip",
+            signature=MOCK_SIG,
+            pubkey=MOCK_PEM,
+            regexp=r".*\.zip",
+            filehash=hashlib.sha256(MOCK_ZIP).hexdigest(),
+        )
+
+        result = sig.verify()
+
+        mock_exists.assert_called_once_with("test.zip")
+        open_mock.assert_not_called()
+        self.assertEqual(sig.data, hashlib.sha256(MOCK_ZIP).digest())
+        self.assertEqual(result, True)
@@ -20,7 +20,8 @@ class TestBaseUnzip(TestCase):
     def test_fail_init_not_exists(self, mock_exist):
         with self.assertRaises(ValueError) as exc_info:
             BaseUnzip(filename="test.zip", members=["README.md"])
-            mock_exist.assert_has_calls([call("test.zip"), call(tempfile.gettempdir())])
+
+        mock_exist.assert_has_calls([call("test.zip"), call(tempfile.gettempdir())])
         self.assertEqual(
             str(exc_info.exception), f"Given path not exist: {tempfile.gettempdir()}"
         )
@@ -31,10 +32,9 @@ class TestBaseUnzip(TestCase):
 
         with self.assertRaises(ValueError) as exc_info:
             BaseUnzip(filename="test.zip", members=[])
-            mock_exists.assert_has_calls(
-                [call("test.zip"), call(tempfile.gettempdir())]
-            )
-            mock_zipfile.assert_called_once_with("test.zip", "r")
+
+        mock_exists.assert_called_once_with("test.zip")
+        mock_zipfile.assert_not_called()
         self.assertEqual(str(exc_info.exception), "Members cannot be empty")
 
     @patch(
@@ -81,11 +81,10 @@ class TestBaseUnzip(TestCase):
 
         with self.assertRaises(RuntimeError) as exc_info:
             unzip = BaseUnzip(filename="test.zip", members=["README.md"])
-            mock_exists.assert_has_calls(
-                [call("test.zip"), call(tempfile.gettempdir())]
-            )
 
             unzip.load()
+
+        mock_exists.assert_has_calls([call("test.zip"), call(tempfile.gettempdir())])
         self.assertEqual(str(exc_info.exception), "Cannot open test.zip: None")
 
     def test_sanitized_base_name(self):
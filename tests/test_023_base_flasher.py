@@ -19,8 +19,8 @@ class TestBaseFlasher(TestCase):
         with self.assertRaises(ValueError) as exc_info:
             b = BaseFlasher()
             b.firmware = "mock/test/kboot.kfpkg"
-            mock_exists.assert_called_once_with("mock/test/kboot.kfpkg")
 
+        mock_exists.assert_called_with("mock/test/kboot.kfpkg")
         self.assertEqual(
             str(exc_info.exception), "File do not exist: mock/test/kboot.kfpkg"
         )
@@ -28,66 +28,24 @@ class TestBaseFlasher(TestCase):
     @patch(
         "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
     )
-    def test_set_port_amigo(self, mock_grep):
-        f = BaseFlasher()
-        f.port = "amigo"
-        mock_grep.assert_called_once_with("0403")
-
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_amigo_tft(self, mock_grep):
-        f = BaseFlasher()
-        f.port = "amigo_tft"
-        mock_grep.assert_called_once_with("0403")
-
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_amigo_ips(self, mock_grep):
-        f = BaseFlasher()
-        f.port = "amigo_ips"
-        mock_grep.assert_called_once_with("0403")
-
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_m5stickv(self, mock_grep):
-        f = BaseFlasher()
-        f.port = "m5stickv"
-        mock_grep.assert_called_once_with("0403")
-
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_bit(self, mock_grep):
-        f = BaseFlasher()
-        f.port = "bit"
-        mock_grep.assert_called_once_with("0403")
-
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_ports_cube(self, mock_grep):
-        f = BaseFlasher()
-        f.port = "cube"
-        mock_grep.assert_called_once_with("0403")
-
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_dock(self, mock_grep):
-        f = BaseFlasher()
-        f.port = "dock"
-        mock_grep.assert_called_once_with("7523")
-
-    @patch(
-        "src.utils.flasher.base_flasher.list_ports.grep", new_callable=MockListPortsGrep
-    )
-    def test_set_port_yahboom(self, mock_grep):
-        f = BaseFlasher()
-        f.port = "yahboom"
-        mock_grep.assert_called_once_with("7523")
+    def test_set_port(self, mock_grep):
+        f = BaseFlasher()
+        for device, vid in (
+            ("amigo", "0403"),
+            ("amigo_tft", "0403"),
+            ("amigo_ips", "0403"),
+            ("m5stickv", "0403"),
+            ("bit", "0403"),
+            ("cube", "0403"),
+            ("dock", "7523"),
+            ("yahboom", "7523"),
+            ("wonder_mv", "7523"),
+        ):
+            with self.subTest(device=device):
+                f.port = device
+                mock_grep.assert_called_with(vid)
+
+        self.assertEqual(mock_grep.call_count, 9)
 
     def test_fail_set_port(self):
         with self.assertRaises(ValueError) as exc_info:
@@ -96,45 +54,22 @@ class TestBaseFlasher(TestCase):
 
         self.assertEqual(str(exc_info.exception), "Device not implemented: mock")
 
-    def test_set_board_amigo(self):
-        f = BaseFlasher()
-        f.board = "amigo"
-        self.assertEqual(f.board, "goE")
-
-    def test_set_board_amigo_tft(self):
-        f = BaseFlasher()
-        f.board = "amigo_tft"
-        self.assertEqual(f.board, "goE")
-
-    def test_set_board_amigo_ips(self):
-        f = BaseFlasher()
-        f.board = "amigo_ips"
-        self.assertEqual(f.board, "goE")
-
-    def test_set_board_m5stickv(self):
-        f = BaseFlasher()
-        f.board = "m5stickv"
-        self.assertEqual(f.board, "goE")
-
-    def test_set_board_bit(self):
-        f = BaseFlasher()
-        f.board = "bit"
-        self.assertEqual(f.board, "goE")
-
-    def test_set_board_dock(self):
-        f = BaseFlasher()
-        f.board = "dock"
-        self.assertEqual(f.board, "dan")
-
-    def test_set_board_yahboom(self):
-        f = BaseFlasher()
-        f.board = "yahboom"
-        self.assertEqual(f.board, "goE")
-
-    def test_set_board_cube(self):
-        f = BaseFlasher()
-        f.board = "cube"
-        self.assertEqual(f.board, "goE")
+    def test_set_board(self):
+        f = BaseFlasher()
+        for device, board in (
+            ("amigo", "goE"),
+            ("amigo_tft", "goE"),
+            ("amigo_ips", "goE"),
+            ("m5stickv", "goE"),
+            ("bit", "goE"),
+            ("yahboom", "goE"),
+            ("cube", "goE"),
+            ("dock", "dan"),
+            ("wonder_mv", "dan"),
+        ):
+            with self.subTest(device=device):
+                f.board = device
+                self.assertEqual(f.board, board)
 
     def test_fail_set_board(self):
         with self.assertRaises(ValueError) as exc_info:
@@ -16,8 +16,8 @@ class TestBaseSigner(TestCase):
     def test_fail_filename(self, mock_exists):
         with self.assertRaises(ValueError) as exc_info:
             BaseSigner(filename="mock.txt")
-            mock_exists.assert_called_once_with("mock.txt")
 
+        mock_exists.assert_called_once_with("mock.txt")
         self.assertEqual(str(exc_info.exception), "mock.txt do not exists")
 
     @patch("os.path.exists", return_value=True)
@@ -37,8 +37,8 @@ class TestBaseSigner(TestCase):
             s.filehash = (
                 "5h98101992i1b411j05050klm665n16o1pqfd88rst9uv3wd55eefa046a3f4ab9"
             )
-            mock_exists.assert_called_once_with("mock.txt")
 
+        mock_exists.assert_called_once_with("mock.txt")
         self.assertEqual(
             str(exc_info.exception),
             "Invalid hash: 5h98101992i1b411j05050klm665n16o1pqfd88rst9uv3wd55eefa046a3f4ab9",
@@ -68,8 +68,8 @@ class TestBaseSigner(TestCase):
         with self.assertRaises(ValueError) as exc_info:
             s = BaseSigner(filename="mock.txt")
             s.signature = "*&ï&*$#@!@#)*&&*%%"
-            mock_exists.assert_called_once_with("mock.txt")
 
+        mock_exists.assert_called_once_with("mock.txt")
         self.assertEqual(
             str(exc_info.exception), "Invalid signature: *&ï&*$#@!@#)*&&*%%"
         )
@@ -89,6 +89,6 @@ class TestBaseSigner(TestCase):
         with self.assertRaises(ValueError) as exc_info:
             s = BaseSigner(filename="mock.txt")
             s.pubkey = "abcdef0123456789"
-            mock_exists.assert_called_once_with("mock.txt")
 
+        mock_exists.assert_called_once_with("mock.txt")
         self.assertEqual(str(exc_info.exception), "Invalid pubkey: abcdef0123456789")
@@ -23,7 +23,8 @@ class TestTriggerSigner(TestCase):
         with self.assertRaises(ValueError) as exc_info:
             s = TriggerSigner(filename="mock.txt")
             s.save_hash()
-            mock_exists.assert_called_once_with("mock.txt")
+
+        mock_exists.assert_called_once_with("mock.txt")
         self.assertEqual(str(exc_info.exception), "Empty hash")
 
     @patch("os.path.exists", return_value=True)
@@ -55,7 +56,8 @@ class TestTriggerSigner(TestCase):
         with self.assertRaises(ValueError) as exc_info:
             s = TriggerSigner(filename="mock.txt")
             s.save_signature()
-            mock_exists.assert_called_once_with("mock.txt")
+
+        mock_exists.assert_called_once_with("mock.txt")
         self.assertEqual(str(exc_info.exception), "Empty signature")
 
     @patch("os.path.exists", return_value=True)
@@ -83,7 +85,8 @@ class TestTriggerSigner(TestCase):
         with self.assertRaises(ValueError) as exc_info:
             s = TriggerSigner(filename="mock.txt")
             s.save_pubkey()
-            mock_exists.assert_called_once_with("mock.txt")
+
+        mock_exists.assert_called_once_with("mock.txt")
         self.assertEqual(str(exc_info.exception), "Empty pubkey")
 
     @patch("os.path.exists", return_value=True)